@@ -1,3 +1,4 @@
+import logging
 import uvicorn
 import os
 from dotenv import load_dotenv
@@ -8,8 +9,42 @@ load_dotenv()
 # Get configuration from environment variables
 HOST = os.getenv('HOST', '0.0.0.0')
 PORT = int(os.getenv('PORT', 8000))
-RELOAD = os.getenv('RELOAD', 'True').lower() == 'true'
+RELOAD = os.getenv('RELOAD', 'False').lower() == 'true'
+WORKERS = int(os.getenv('WORKERS', 1))
+LOOP = os.getenv('LOOP', 'auto')
+HTTP = os.getenv('HTTP', 'auto')
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'warning').lower()
+
+# Map uvicorn log levels to stdlib levels ('trace' has no stdlib equivalent);
+# unknown values fall back to the default
+LOG_LEVELS = {
+    'critical': logging.CRITICAL,
+    'error': logging.ERROR,
+    'warning': logging.WARNING,
+    'info': logging.INFO,
+    'debug': logging.DEBUG,
+    'trace': logging.DEBUG
+}
+if LOG_LEVEL not in LOG_LEVELS:
+    LOG_LEVEL = 'warning'
+
+# Configure application logging (library modules only attach a NullHandler)
+logging.basicConfig(
+    level=LOG_LEVELS[LOG_LEVEL],
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
 
 if __name__ == '__main__':
     print(f"Starting API server on {HOST}:{PORT}")
-    uvicorn.run("src.api.app:app", host=HOST, port=PORT, reload=RELOAD)
\ No newline at end of file
+    # 'auto' uses uvloop and httptools when installed, falling back to asyncio and h11;
+    # reload is a development option and ignores WORKERS when enabled
+    uvicorn.run(
+        "src.api.app:app",
+        host=HOST,
+        port=PORT,
+        reload=RELOAD,
+        loop=LOOP,
+        http=HTTP,
+        workers=WORKERS,
+        log_level=LOG_LEVEL
+    )
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Optional build script that compiles the data consistency helpers with mypyc.
+
+The compiled extension is a drop-in replacement for the pure Python module:
+    pip install -r requirements-dev.txt
+    python setup.py build_ext --inplace
+
+`pip install .` builds and installs the package with the compiled extension.
+"""
+from setuptools import find_packages, setup
+from mypyc.build import mypycify
+
+setup(
+    name='cricket-prediction-system',
+    version='1.0.0',
+    # Ship the pure Python modules next to the compiled extension
+    packages=find_packages(include=['src', 'src.*']),
+    ext_modules=mypycify(
+        ['src/utils/helpers/data_consistency.py'],
+        opt_level='3'
+    )
+)
\ No newline at end of file
@@ -0,0 +1,243 @@
+"""
+Vectorized kernels for the data consistency module.
+This module applies the batting and bowling consistency rules to whole NumPy arrays at once.
+"""
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Value types the kernels handle; rows holding anything else use the scalar path
+_NUMBER_TYPES = {int, float}
+
+# Larger ints use the scalar path, so products of two ints stay exact as floats
+_INT_LIMIT = 2 ** 26
+
+# Below this, scaled values stay under 2**53, so np.rint rounds them to exact integers
+_ROUNDING_LIMIT = 2.0 ** 49
+
+
+def _round(values: np.ndarray) -> np.ndarray:
+    """
+    Round non-negative values to 1 decimal exactly like round(value, 1).
+    
+    Scaling by 10 may push a value within a few ulps of a halfway point
+    across it, so those values (and huge or infinite ones) use round().
+    """
+    scaled = values * 10
+    rounded = np.rint(scaled)
+    result = rounded / 10
+    unsure = ~(values < _ROUNDING_LIMIT) | (0.5 - np.abs(scaled - rounded) <= scaled * 2.0 ** -50)
+    if unsure.any():
+        result[unsure] = [round(value, 1) for value in values[unsure].tolist()]
+    return result
+
+
+def _clip_below(values: np.ndarray, ints: np.ndarray, minimum: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Replace values not above minimum (including NaN) with minimum, which the scalar path keeps as an int."""
+    keep = values > minimum
+    return np.where(keep, values, minimum), ints | ~keep
+
+
+def _bat_kernel(runs: np.ndarray, balls: np.ndarray, strike_rate: np.ndarray, fours: np.ndarray,
+                sixes: np.ndarray, ints: np.ndarray) -> Tuple[Tuple[np.ndarray, ...], Tuple[np.ndarray, ...]]:
+    """
+    Apply the batting consistency rules to parallel arrays of player stats.
+    
+    Args:
+        runs: Expected runs per player
+        balls: Expected balls per player
+        strike_rate: Expected strike rate per player
+        fours: Expected fours per player
+        sixes: Expected sixes per player
+        ints: Whether each input value is an int, one column per field
+    
+    Returns:
+        Tuple of consistent (runs, balls, strike_rate, fours, sixes) arrays,
+        and a tuple of arrays marking the values the scalar path returns as ints
+    """
+    runs_int, balls_int, strike_rate_int, fours_int, sixes_int = ints.T
+    
+    # 1. Strike rate = (runs / balls) * 100, or derive balls from strike rate
+    has_balls = balls > 0
+    strike_rate = np.where(has_balls, runs / np.where(has_balls, balls, 1.0) * 100, strike_rate)
+    strike_rate_int = strike_rate_int & ~has_balls
+    derive_balls = ~has_balls & (strike_rate > 0)
+    balls = np.where(derive_balls, runs / np.where(derive_balls, strike_rate, 1.0) * 100, balls)
+    balls_int = balls_int & ~derive_balls
+    
+    # 2. Scale down boundaries proportionally where they exceed total runs
+    boundary_runs = fours * 4 + sixes * 6
+    scale_down = boundary_runs > runs
+    scale_factor = runs / np.where(boundary_runs >= 1, boundary_runs, 1.0)
+    fours = np.where(scale_down, fours * scale_factor, fours)
+    sixes = np.where(scale_down, sixes * scale_factor, sixes)
+    fours_int = fours_int & ~scale_down
+    sixes_int = sixes_int & ~scale_down
+    
+    # 3. Ensure non-zero values for key metrics
+    runs, runs_int = _clip_below(runs, runs_int, 0.0)
+    balls, balls_int = _clip_below(balls, balls_int, 1.0)
+    strike_rate, strike_rate_int = _clip_below(strike_rate, strike_rate_int, 0.0)
+    fours, fours_int = _clip_below(fours, fours_int, 0.0)
+    sixes, sixes_int = _clip_below(sixes, sixes_int, 0.0)
+    
+    return (
+        (_round(runs), _round(balls), _round(strike_rate), _round(fours), _round(sixes)),
+        (runs_int, balls_int, strike_rate_int, fours_int, sixes_int)
+    )
+
+
+def _bowl_kernel(overs: np.ndarray, economy: np.ndarray, wickets: np.ndarray, runs_conceded: np.ndarray,
+                 ints: np.ndarray, max_overs: float) -> Tuple[Tuple[np.ndarray, ...], Tuple[np.ndarray, ...]]:
+    """
+    Apply the bowling consistency rules to parallel arrays of player stats.
+    
+    Args:
+        overs: Expected overs per player
+        economy: Expected economy per player
+        wickets: Expected wickets per player
+        runs_conceded: Expected runs conceded per player
+        ints: Whether each input value is an int, one column per field
+        max_overs: Maximum overs per bowler for the format (inf if uncapped)
+    
+    Returns:
+        Tuple of consistent (overs, economy, wickets, runs_conceded) arrays,
+        and a tuple of arrays marking the values the scalar path returns as ints
+    """
+    overs_int, economy_int, wickets_int, runs_conceded_int = ints.T
+    
+    # 1. Runs conceded = economy * overs, or derive economy from runs conceded
+    has_overs = overs > 0
+    from_economy = has_overs & (economy > 0)
+    from_runs = has_overs & ~from_economy & (runs_conceded > 0)
+    new_runs_conceded = np.where(from_economy, economy * overs, runs_conceded)
+    runs_conceded_int = np.where(from_economy, economy_int & overs_int, runs_conceded_int)
+    economy = np.where(from_runs, runs_conceded / np.where(has_overs, overs, 1.0), economy)
+    economy_int = economy_int & ~from_runs
+    
+    # 2. Ensure format-specific constraints (over caps are ints)
+    capped = overs > max_overs
+    overs = np.where(capped, max_overs, overs)
+    overs_int = overs_int | capped
+    
+    # 3. Ensure non-zero values for key metrics
+    overs, overs_int = _clip_below(overs, overs_int, 0.0)
+    economy, economy_int = _clip_below(economy, economy_int, 0.0)
+    wickets, wickets_int = _clip_below(wickets, wickets_int, 0.0)
+    new_runs_conceded, runs_conceded_int = _clip_below(new_runs_conceded, runs_conceded_int, 0.0)
+    
+    return (
+        (_round(overs), _round(economy), _round(wickets), _round(new_runs_conceded)),
+        (overs_int, economy_int, wickets_int, runs_conceded_int)
+    )
+
+
+def _int_mask(values: List[Tuple[Any, ...]], current: np.ndarray) -> np.ndarray:
+    """
+    Mark the int values in a batch.
+    
+    Only values that are whole numbers can be ints, so just those are checked.
+    
+    Args:
+        values: Field values per row
+        current: The same values as a float array
+    
+    Returns:
+        Boolean array marking the int values
+    """
+    ints = np.zeros(current.shape, dtype=bool)
+    candidates = np.nonzero(current == np.floor(current))
+    ints[candidates] = [type(values[row][column]) is int for row, column in zip(*(c.tolist() for c in candidates))]
+    return ints
+
+
+def _kernel_rows(values: List[Tuple[Any, ...]]) -> List[int]:
+    """
+    Find the rows the kernels handle exactly like the scalar path.
+    
+    Args:
+        values: Field values per row
+    
+    Returns:
+        Indices of rows holding only floats and ints within _INT_LIMIT
+    """
+    return [
+        index for index, row_values in enumerate(values)
+        if all(type(value) is float or (type(value) is int and -_INT_LIMIT <= value <= _INT_LIMIT)
+               for value in row_values)
+    ]
+
+
+def _update_rows(rows: List[Dict[str, Any]], keys: Tuple[str, ...], getter: Callable[[Dict[str, Any]], Tuple[Any, ...]],
+                 kernel: Callable[..., Tuple[Tuple[np.ndarray, ...], Tuple[np.ndarray, ...]]], fallback: Callable[[Dict[str, Any]], Any],
+                 *args: Any) -> None:
+    """
+    Apply a consistency kernel to a list of stat dictionaries in place.
+    
+    Values are read in one pass per row and only values that change are
+    written back, with the same int or float type as in the scalar path.
+    Rows holding values other than floats and small ints (e.g. None, strings
+    or ints too large for a float) are passed to the scalar function instead,
+    so they are accepted or rejected exactly as in the scalar path.
+    
+    Args:
+        rows: Stat dictionaries to update
+        keys: Fields read and written, in kernel argument order
+        getter: itemgetter for keys
+        kernel: Consistency kernel taking one array per field and an int mask
+        fallback: Scalar consistency function updating one row in place
+        *args: Extra kernel arguments
+    """
+    try:
+        values = list(map(getter, rows))
+        # Every field is present, so only changed values need writing
+        missing = None
+    except KeyError:
+        values = [tuple(row.get(key, 0) for key in keys) for row in rows]
+        # Missing fields are always written, as in the scalar path
+        missing = np.array([[key not in row for key in keys] for row in rows])
+    
+    # Check value types once for the whole batch, and per row only if some cannot be converted exactly
+    current: Optional[np.ndarray] = None
+    types = set(map(type, chain.from_iterable(values)))
+    if types <= _NUMBER_TYPES:
+        try:
+            current = np.array(values, dtype=np.float64)
+        except OverflowError:
+            current = None
+        if current is not None and int in types and not (np.abs(current) <= _INT_LIMIT).all():
+            current = None
+    if current is None:
+        # Validate the other rows one at a time with the scalar function
+        kernel_indices = _kernel_rows(values)
+        selected = set(kernel_indices)
+        for index, row in enumerate(rows):
+            if index not in selected:
+                fallback(row)
+        if not kernel_indices:
+            return
+        rows = [rows[index] for index in kernel_indices]
+        values = [values[index] for index in kernel_indices]
+        current = np.array(values, dtype=np.float64)
+        if missing is not None:
+            missing = missing[kernel_indices]
+    
+    # The scalar path returns ints where its inputs or clamping limits are ints
+    ints = _int_mask(values, current) if int in types else np.zeros(current.shape, dtype=bool)
+    
+    # Infinite inputs may produce inf/NaN intermediates, handled as in the scalar path
+    with np.errstate(all='ignore'):
+        result_columns, int_columns = kernel(*current.T, ints, *args)
+    result = np.column_stack(result_columns)
+    result_ints = np.column_stack(int_columns)
+    changed = result != current
+    if missing is not None:
+        changed |= missing
+    
+    # Write column by column so missing keys are added in field order
+    for column, key in enumerate(keys):
+        indices = np.flatnonzero(changed[:, column])
+        for index, value, is_int in zip(indices.tolist(), result[indices, column].tolist(),
+                                        result_ints[indices, column].tolist()):
+            rows[index][key] = int(value) if is_int else value
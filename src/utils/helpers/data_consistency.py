@@ -2,267 +2,561 @@
 Data consistency module for cricket prediction system.
 This module ensures data consistency across the system.
 """
+import functools
 import logging
-from typing import Dict, List, Any, Optional, Union, Tuple
+import math
+import operator
+from types import MappingProxyType
+from typing import Callable, ClassVar, Dict, List, Any, Mapping, Optional, Union, Tuple
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Library module: leave handler and level configuration to the application
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
-class DataConsistency:
-    """
-    Ensures data consistency across the cricket prediction system.
+# Shared read-only default for missing nested dictionaries
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Field order shared by the scalar and batch consistency paths
+_BAT_KEYS = ('expected_runs', 'expected_balls', 'expected_strike_rate', 'expected_fours', 'expected_sixes')
+_BOWL_KEYS = ('expected_overs', 'expected_economy', 'expected_wickets', 'expected_runs_conceded')
+_BAT_GET = operator.itemgetter(*_BAT_KEYS)
+_BOWL_GET = operator.itemgetter(*_BOWL_KEYS)
+
+# Maximum overs per bowler per format
+_OVER_CAPS = {
+    'T20I': 4,
+    'T20': 4,
+    'ODI': 10
+}
+
+# Typical team score range (low, high) per format
+_SCORE_RANGES = {
+    'T20I': (120, 220),
+    'T20': (120, 220),
+    'ODI': (200, 350),
+    'TEST': (0, 700)
+}
+
+# Role limit values stay as written (ints are not converted to float when compiled with mypyc)
+_RoleRule = Tuple[Union[int, float], Union[int, float], Union[int, float], Union[int, float]]
+
+# Role-based limits as (min_runs, max_runs, min_wickets, max_wickets)
+_ROLE_RULES: Dict[str, _RoleRule] = {
+    # Specialist batsmen should have higher expected runs and not be predicted to take wickets
+    'batsman': (20, math.inf, -math.inf, 0.5),
+    # Specialist bowlers should have lower expected runs and higher expected wickets
+    'bowler': (-math.inf, 15, 1, math.inf),
+    # All-rounders should have moderate expected runs and wickets
+    'allrounder': (15, math.inf, 0.5, math.inf)
+}
+
+# Exact role names mapped to their canonical role
+_ROLE_ALIASES = {
+    'batsman': 'batsman',
+    'batter': 'batsman',
+    'bowler': 'bowler',
+    'all-rounder': 'allrounder',
+    'all rounder': 'allrounder',
+    'allrounder': 'allrounder'
+}
+
+
+def _match_role(role: str) -> Optional[str]:
     """
+    Resolve a descriptive role (e.g. "opening batsman") to its canonical role.
     
-    @staticmethod
-    def ensure_batting_consistency(batting_data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Ensure batting data consistency.
-        
-        Args:
-            batting_data: Batting data dictionary
-            
-        Returns:
-            Consistent batting data
-        """
-        # Extract key metrics
-        runs = batting_data.get('expected_runs', 0)
-        balls = batting_data.get('expected_balls', 0)
-        strike_rate = batting_data.get('expected_strike_rate', 0)
-        fours = batting_data.get('expected_fours', 0)
-        sixes = batting_data.get('expected_sixes', 0)
-        
-        # Ensure mathematical consistency
-        
-        # 1. Strike rate = (runs / balls) * 100
-        if balls > 0:
-            strike_rate = (runs / balls) * 100
-        elif strike_rate > 0:
-            balls = (runs / strike_rate) * 100
+    Args:
+        role: Lower-cased player role
         
-        # 2. Ensure boundary runs don't exceed total runs
-        boundary_runs = (fours * 4) + (sixes * 6)
-        if boundary_runs > runs:
-            # Scale down boundaries proportionally
-            scale_factor = runs / max(1, boundary_runs)
-            fours = fours * scale_factor
-            sixes = sixes * scale_factor
-        
-        # 3. Ensure non-zero values for key metrics
-        runs = max(0, runs)
-        balls = max(1, balls)
-        strike_rate = max(0, strike_rate)
-        fours = max(0, fours)
-        sixes = max(0, sixes)
-        
-        # Update data
-        batting_data.update({
-            'expected_runs': round(runs, 1),
-            'expected_balls': round(balls, 1),
-            'expected_strike_rate': round(strike_rate, 1),
-            'expected_fours': round(fours, 1),
-            'expected_sixes': round(sixes, 1)
-        })
-        
-        return batting_data
+    Returns:
+        Canonical role, or None if the role has no consistency rules
+    """
+    if 'batsman' in role or 'batter' in role:
+        return 'batsman'
+    if 'bowler' in role:
+        return 'bowler'
+    if 'all-rounder' in role or 'all rounder' in role or 'allrounder' in role:
+        return 'allrounder'
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_role(role: str) -> Optional[_RoleRule]:
+    """
+    Resolve a player role to its consistency limits.
     
-    @staticmethod
-    def ensure_bowling_consistency(bowling_data: Dict[str, Any], format_type: str = 'T20I') -> Dict[str, Any]:
-        """
-        Ensure bowling data consistency.
-        
-        Args:
-            bowling_data: Bowling data dictionary
-            format_type: Match format
-            
-        Returns:
-            Consistent bowling data
-        """
-        # Extract key metrics
-        overs = bowling_data.get('expected_overs', 0)
-        economy = bowling_data.get('expected_economy', 0)
-        wickets = bowling_data.get('expected_wickets', 0)
-        runs_conceded = bowling_data.get('expected_runs_conceded', 0)
-        
-        # Ensure mathematical consistency
-        
-        # 1. Runs conceded = economy * overs
-        if overs > 0 and economy > 0:
-            runs_conceded = economy * overs
-        elif runs_conceded > 0 and overs > 0:
-            economy = runs_conceded / overs
-        
-        # 2. Ensure format-specific constraints
-        if format_type.upper() == 'T20I':
-            overs = min(overs, 4)  # Max 4 overs in T20
-        elif format_type.upper() == 'ODI':
-            overs = min(overs, 10)  # Max 10 overs in ODI
+    Player pools only contain a handful of distinct role strings, so the
+    result is cached per raw role.
+    
+    Args:
+        role: Player role as it appears in the player data
         
-        # 3. Ensure non-zero values for key metrics
-        overs = max(0, overs)
-        economy = max(0, economy)
-        wickets = max(0, wickets)
-        runs_conceded = max(0, runs_conceded)
+    Returns:
+        (min_runs, max_runs, min_wickets, max_wickets), or None if the role has no rules
+    """
+    role = role.lower()
+    canonical_role = _ROLE_ALIASES.get(role) or _match_role(role)
+    if canonical_role is None:
+        return None
+    return _ROLE_RULES[canonical_role]
+
+
+def ensure_batting_consistency(batting_data: Dict[str, Any], copy: bool = True) -> Dict[str, Any]:
+    """
+    Ensure batting data consistency.
+    
+    Args:
+        batting_data: Batting data dictionary
+        copy: Whether to return an updated copy instead of modifying the input in place
         
-        # Update data
-        bowling_data.update({
-            'expected_overs': round(overs, 1),
-            'expected_economy': round(economy, 1),
-            'expected_wickets': round(wickets, 1),
-            'expected_runs_conceded': round(runs_conceded, 1)
-        })
+    Returns:
+        Consistent batting data
+    """
+    # Extract key metrics, falling back to defaults for partial data
+    try:
+        runs, balls, strike_rate, fours, sixes = _BAT_GET(batting_data)
+    except KeyError:
+        get = batting_data.get
+        runs = get('expected_runs', 0)
+        balls = get('expected_balls', 0)
+        strike_rate = get('expected_strike_rate', 0)
+        fours = get('expected_fours', 0)
+        sixes = get('expected_sixes', 0)
+    
+    # Ensure mathematical consistency
+    
+    # 1. Strike rate = (runs / balls) * 100
+    if balls > 0:
+        strike_rate = (runs / balls) * 100
+    elif strike_rate > 0:
+        balls = (runs / strike_rate) * 100
+    
+    # 2. Ensure boundary runs don't exceed total runs
+    boundary_runs = (fours * 4) + (sixes * 6)
+    if boundary_runs > runs:
+        # Scale down boundaries proportionally
+        scale_factor = runs / (boundary_runs if boundary_runs >= 1 else 1)
+        fours = fours * scale_factor
+        sixes = sixes * scale_factor
+    
+    # 3. Ensure non-zero values for key metrics
+    runs = runs if runs > 0 else 0
+    balls = balls if balls > 1 else 1
+    strike_rate = strike_rate if strike_rate > 0 else 0
+    fours = fours if fours > 0 else 0
+    sixes = sixes if sixes > 0 else 0
+    
+    # Round to 1 decimal
+    runs = round(runs, 1)
+    balls = round(balls, 1)
+    strike_rate = round(strike_rate, 1)
+    fours = round(fours, 1)
+    sixes = round(sixes, 1)
+    
+    # Update only the values that changed
+    if copy:
+        batting_data = dict(batting_data)
+    get = batting_data.get
+    if get('expected_runs') != runs:
+        batting_data['expected_runs'] = runs
+    if get('expected_balls') != balls:
+        batting_data['expected_balls'] = balls
+    if get('expected_strike_rate') != strike_rate:
+        batting_data['expected_strike_rate'] = strike_rate
+    if get('expected_fours') != fours:
+        batting_data['expected_fours'] = fours
+    if get('expected_sixes') != sixes:
+        batting_data['expected_sixes'] = sixes
+    
+    return batting_data
+
+
+def ensure_bowling_consistency(bowling_data: Dict[str, Any], format_type: Optional[str] = 'T20I',
+                               copy: bool = True) -> Dict[str, Any]:
+    """
+    Ensure bowling data consistency.
+    
+    Args:
+        bowling_data: Bowling data dictionary
+        format_type: Match format (T20I if None)
+        copy: Whether to return an updated copy instead of modifying the input in place
         
-        return bowling_data
+    Returns:
+        Consistent bowling data
+    """
+    # Extract key metrics, falling back to defaults for partial data
+    try:
+        overs, economy, wickets, runs_conceded = _BOWL_GET(bowling_data)
+    except KeyError:
+        get = bowling_data.get
+        overs = get('expected_overs', 0)
+        economy = get('expected_economy', 0)
+        wickets = get('expected_wickets', 0)
+        runs_conceded = get('expected_runs_conceded', 0)
+    
+    # Ensure mathematical consistency
+    
+    # 1. Runs conceded = economy * overs
+    if overs > 0 and economy > 0:
+        runs_conceded = economy * overs
+    elif runs_conceded > 0 and overs > 0:
+        economy = runs_conceded / overs
+    
+    # 2. Ensure format-specific constraints
+    cap = _OVER_CAPS.get((format_type or 'T20I').upper())
+    if cap is not None and overs > cap:
+        overs = cap
+    
+    # 3. Ensure non-zero values for key metrics
+    overs = overs if overs > 0 else 0
+    economy = economy if economy > 0 else 0
+    wickets = wickets if wickets > 0 else 0
+    runs_conceded = runs_conceded if runs_conceded > 0 else 0
+    
+    # Round to 1 decimal
+    overs = round(overs, 1)
+    economy = round(economy, 1)
+    wickets = round(wickets, 1)
+    runs_conceded = round(runs_conceded, 1)
+    
+    # Update only the values that changed
+    if copy:
+        bowling_data = dict(bowling_data)
+    get = bowling_data.get
+    if get('expected_overs') != overs:
+        bowling_data['expected_overs'] = overs
+    if get('expected_economy') != economy:
+        bowling_data['expected_economy'] = economy
+    if get('expected_wickets') != wickets:
+        bowling_data['expected_wickets'] = wickets
+    if get('expected_runs_conceded') != runs_conceded:
+        bowling_data['expected_runs_conceded'] = runs_conceded
+    
+    return bowling_data
+
+
+def ensure_batting_consistency_many(batting_rows: List[Dict[str, Any]], copy: bool = True) -> List[Dict[str, Any]]:
+    """
+    Ensure batting data consistency for many players in one call.
     
-    @staticmethod
-    def ensure_player_role_consistency(player_data: Dict[str, Any], prediction: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Ensure player role consistency in predictions.
+    Args:
+        batting_rows: List of batting data dictionaries
+        copy: Whether to return an updated copy instead of modifying the input in place
         
-        Args:
-            player_data: Player data dictionary
-            prediction: Player prediction dictionary
-            
-        Returns:
-            Consistent player prediction
-        """
-        # Get player role
-        role = player_data.get('personalInformation', {}).get('role', '').lower()
+    Returns:
+        Consistent batting data, in input order
+    """
+    if copy:
+        batting_rows = [dict(row) for row in batting_rows]
+    if not batting_rows:
+        return batting_rows
+    
+    # NumPy is only needed for batches, so keep it out of the module import
+    from ._consistency_kernels import _bat_kernel, _update_rows
+    
+    _update_rows(batting_rows, _BAT_KEYS, _BAT_GET, _bat_kernel,
+                 functools.partial(ensure_batting_consistency, copy=False))
+    
+    return batting_rows
+
+
+def ensure_bowling_consistency_many(bowling_rows: List[Dict[str, Any]], format_type: Optional[str] = 'T20I',
+                                    copy: bool = True) -> List[Dict[str, Any]]:
+    """
+    Ensure bowling data consistency for many players in one call.
+    
+    Args:
+        bowling_rows: List of bowling data dictionaries
+        format_type: Match format (T20I if None)
+        copy: Whether to return an updated copy instead of modifying the input in place
         
-        # Adjust prediction based on role
-        if 'batsman' in role:
-            # Specialist batsmen should have higher expected runs
-            if 'batting' in prediction:
-                runs = prediction['batting'].get('expected_runs', 0)
-                if runs < 20:
-                    prediction['batting']['expected_runs'] = max(runs, 20)
-            
-            # Specialist batsmen should not be predicted to take wickets
-            if 'bowling' in prediction:
-                wickets = prediction['bowling'].get('expected_wickets', 0)
-                if wickets > 0.5:
-                    prediction['bowling']['expected_wickets'] = min(wickets, 0.5)
-        elif 'bowler' in role:
-            # Specialist bowlers should have lower expected runs
-            if 'batting' in prediction:
-                runs = prediction['batting'].get('expected_runs', 0)
-                if runs > 15:
-                    prediction['batting']['expected_runs'] = min(runs, 15)
-            
-            # Specialist bowlers should have higher expected wickets
-            if 'bowling' in prediction:
-                wickets = prediction['bowling'].get('expected_wickets', 0)
-                if wickets < 1:
-                    prediction['bowling']['expected_wickets'] = max(wickets, 1)
-        elif 'all-rounder' in role or 'all rounder' in role:
-            # All-rounders should have moderate expected runs and wickets
-            if 'batting' in prediction:
-                runs = prediction['batting'].get('expected_runs', 0)
-                if runs < 15:
-                    prediction['batting']['expected_runs'] = max(runs, 15)
-            
-            if 'bowling' in prediction:
-                wickets = prediction['bowling'].get('expected_wickets', 0)
-                if wickets < 0.5:
-                    prediction['bowling']['expected_wickets'] = max(wickets, 0.5)
+    Returns:
+        Consistent bowling data, in input order
+    """
+    if copy:
+        bowling_rows = [dict(row) for row in bowling_rows]
+    if not bowling_rows:
+        return bowling_rows
+    
+    from ._consistency_kernels import _bowl_kernel, _update_rows
+    
+    max_overs = _OVER_CAPS.get((format_type or 'T20I').upper(), math.inf)
+    _update_rows(bowling_rows, _BOWL_KEYS, _BOWL_GET, _bowl_kernel,
+                 functools.partial(ensure_bowling_consistency, format_type=format_type, copy=False), max_overs)
+    
+    return bowling_rows
+
+
+def ensure_player_role_consistency(player_data: Dict[str, Any], prediction: Dict[str, Any],
+                                   copy: bool = True) -> Dict[str, Any]:
+    """
+    Ensure player role consistency in predictions.
+    
+    Args:
+        player_data: Player data dictionary
+        prediction: Player prediction dictionary
+        copy: Whether to return an updated copy instead of modifying the input in place
         
+    Returns:
+        Consistent player prediction
+    """
+    if copy:
+        prediction = dict(prediction)
+    
+    # Get player role
+    personal_information = player_data.get('personalInformation') or _EMPTY
+    rule = _resolve_role(personal_information.get('role') or '')
+    if rule is None:
         return prediction
     
-    @staticmethod
-    def ensure_fantasy_team_consistency(fantasy_team: Dict[str, Any], format_type: str = 'T20I') -> Dict[str, Any]:
-        """
-        Ensure fantasy team consistency.
+    # Clamp expected runs and wickets to the limits for the role
+    min_runs, max_runs, min_wickets, max_wickets = rule
+    if 'batting' in prediction:
+        runs = prediction['batting'].get('expected_runs', 0)
+        clamped = min(max(runs, min_runs), max_runs)
+        if clamped != runs:
+            if copy:
+                prediction['batting'] = dict(prediction['batting'])
+            prediction['batting']['expected_runs'] = clamped
+    
+    if 'bowling' in prediction:
+        wickets = prediction['bowling'].get('expected_wickets', 0)
+        clamped = min(max(wickets, min_wickets), max_wickets)
+        if clamped != wickets:
+            if copy:
+                prediction['bowling'] = dict(prediction['bowling'])
+            prediction['bowling']['expected_wickets'] = clamped
+    
+    return prediction
+
+
+def ensure_fantasy_team_consistency(fantasy_team: Dict[str, Any], format_type: Optional[str] = 'T20I',
+                                    copy: bool = True) -> Dict[str, Any]:
+    """
+    Ensure fantasy team consistency.
+    
+    Args:
+        fantasy_team: Fantasy team dictionary
+        format_type: Match format (T20I if None)
+        copy: Whether to return an updated copy instead of modifying the input in place
         
-        Args:
-            fantasy_team: Fantasy team dictionary
-            format_type: Match format
-            
-        Returns:
-            Consistent fantasy team
-        """
-        # Ensure we have exactly 11 players
-        players = fantasy_team.get('players', [])
-        if len(players) != 11:
-            logger.warning(f"Fantasy team has {len(players)} players instead of 11")
+    Returns:
+        Consistent fantasy team
+    """
+    if copy:
+        fantasy_team = _copy_fantasy_team(fantasy_team)
+    players = _ensure_fantasy_roster(fantasy_team)
+    
+    # Ensure player performances are consistent (already copied above)
+    for player in players:
+        performance = player.get('performance')
+        if not performance:
+            continue
         
-        # Ensure captain and vice-captain are in the team
-        captain = fantasy_team.get('captain', '')
-        vice_captain = fantasy_team.get('vice_captain', '')
+        # Ensure batting consistency
+        if 'batting' in performance:
+            performance['batting'] = ensure_batting_consistency(performance['batting'], copy=False)
         
-        captain_in_team = any(p.get('name', '') == captain for p in players)
-        vice_captain_in_team = any(p.get('name', '') == vice_captain for p in players)
+        # Ensure bowling consistency
+        if 'bowling' in performance:
+            performance['bowling'] = ensure_bowling_consistency(performance['bowling'], format_type, copy=False)
+    
+    return fantasy_team
+
+
+def ensure_fantasy_team_consistency_batch(fantasy_teams: List[Dict[str, Any]], format_type: Optional[str] = 'T20I',
+                                          copy: bool = True) -> List[Dict[str, Any]]:
+    """
+    Ensure consistency for many fantasy teams at once.
+    
+    Player performances across all teams are gathered into parallel arrays
+    so the consistency rules run as vectorized NumPy operations instead of
+    one dictionary at a time.
+    
+    Args:
+        fantasy_teams: List of fantasy team dictionaries
+        format_type: Match format (T20I if None)
+        copy: Whether to return an updated copy instead of modifying the input in place
         
-        if not captain_in_team and players:
-            logger.warning(f"Captain {captain} not in team, setting first player as captain")
-            fantasy_team['captain'] = players[0].get('name', '')
+    Returns:
+        Consistent fantasy teams
+    """
+    if copy:
+        fantasy_teams = [_copy_fantasy_team(fantasy_team) for fantasy_team in fantasy_teams]
+    
+    batting_rows = []
+    bowling_rows = []
+    for fantasy_team in fantasy_teams:
+        for player in _ensure_fantasy_roster(fantasy_team):
+            performance = player.get('performance') or _EMPTY
+            if 'batting' in performance:
+                batting_rows.append(performance['batting'])
+            if 'bowling' in performance:
+                bowling_rows.append(performance['bowling'])
+    
+    ensure_batting_consistency_many(batting_rows, copy=False)
+    ensure_bowling_consistency_many(bowling_rows, format_type, copy=False)
+    
+    return fantasy_teams
+
+
+def _ensure_fantasy_roster(fantasy_team: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Ensure the fantasy team size, captain and vice-captain are valid.
+    
+    Args:
+        fantasy_team: Fantasy team dictionary
         
-        if not vice_captain_in_team and len(players) > 1:
-            logger.warning(f"Vice-captain {vice_captain} not in team, setting second player as vice-captain")
-            fantasy_team['vice_captain'] = players[1].get('name', '')
+    Returns:
+        List of players in the fantasy team
+    """
+    # Ensure we have exactly 11 players
+    players = fantasy_team.get('players', [])
+    if len(players) != 11:
+        logger.warning("Fantasy team has %d players instead of 11", len(players))
+    
+    # Ensure captain and vice-captain are in the team
+    captain = fantasy_team.get('captain', '')
+    vice_captain = fantasy_team.get('vice_captain', '')
+    
+    names = {p.get('name', '') for p in players}
+    captain_in_team = captain in names
+    vice_captain_in_team = vice_captain in names
+    
+    if not captain_in_team and players:
+        logger.warning("Captain %s not in team, setting first player as captain", captain)
+        fantasy_team['captain'] = players[0].get('name', '')
+    
+    if not vice_captain_in_team and len(players) > 1:
+        logger.warning("Vice-captain %s not in team, setting second player as vice-captain", vice_captain)
+        fantasy_team['vice_captain'] = players[1].get('name', '')
+    
+    return players
+
+
+def _copy_fantasy_team(fantasy_team: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy the parts of a fantasy team that the consistency checks modify.
+    
+    Args:
+        fantasy_team: Fantasy team dictionary
         
-        # Ensure player performances are consistent
-        for player in players:
-            performance = player.get('performance', {})
-            
-            # Ensure batting consistency
+    Returns:
+        Fantasy team sharing no modified dictionaries with the input
+    """
+    fantasy_team = dict(fantasy_team)
+    if 'players' not in fantasy_team:
+        return fantasy_team
+    
+    players = []
+    for player in fantasy_team['players']:
+        player = dict(player)
+        if player.get('performance'):
+            performance = player['performance'] = dict(player['performance'])
             if 'batting' in performance:
-                performance['batting'] = DataConsistency.ensure_batting_consistency(performance['batting'])
-            
-            # Ensure bowling consistency
+                performance['batting'] = dict(performance['batting'])
             if 'bowling' in performance:
-                performance['bowling'] = DataConsistency.ensure_bowling_consistency(performance['bowling'], format_type)
+                performance['bowling'] = dict(performance['bowling'])
+        players.append(player)
+    fantasy_team['players'] = players
+    
+    return fantasy_team
+
+
+def _copy_match_prediction(match_prediction: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy the parts of a match prediction that the consistency checks modify.
+    
+    Args:
+        match_prediction: Match prediction dictionary
         
-        return fantasy_team
+    Returns:
+        Match prediction sharing no modified dictionaries with the input
+    """
+    match_prediction = dict(match_prediction)
+    if match_prediction.get('prediction'):
+        prediction = match_prediction['prediction'] = dict(match_prediction['prediction'])
+        if prediction.get('team_probabilities'):
+            prediction['team_probabilities'] = dict(prediction['team_probabilities'])
+    if match_prediction.get('expected_scores'):
+        match_prediction['expected_scores'] = dict(match_prediction['expected_scores'])
+    
+    return match_prediction
+
+
+def ensure_match_prediction_consistency(match_prediction: Dict[str, Any], format_type: Optional[str] = 'T20I',
+                                        copy: bool = True) -> Dict[str, Any]:
+    """
+    Ensure match prediction consistency.
     
-    @staticmethod
-    def ensure_match_prediction_consistency(match_prediction: Dict[str, Any], format_type: str = 'T20I') -> Dict[str, Any]:
-        """
-        Ensure match prediction consistency.
+    Args:
+        match_prediction: Match prediction dictionary
+        format_type: Match format (T20I if None)
+        copy: Whether to return an updated copy instead of modifying the input in place
         
-        Args:
-            match_prediction: Match prediction dictionary
-            format_type: Match format
+    Returns:
+        Consistent match prediction
+    """
+    if copy:
+        match_prediction = _copy_match_prediction(match_prediction)
+    
+    # Ensure win probabilities sum to 1
+    team_probs = (match_prediction.get('prediction') or _EMPTY).get('team_probabilities')
+    if team_probs:
+        teams = list(team_probs.keys())
+        if len(teams) == 2:
+            team1, team2 = teams
+            prob1 = team_probs.get(team1, 0.5)
+            prob2 = team_probs.get(team2, 0.5)
             
-        Returns:
-            Consistent match prediction
-        """
-        # Ensure win probabilities sum to 1
-        team_probs = match_prediction.get('prediction', {}).get('team_probabilities', {})
-        if team_probs:
-            teams = list(team_probs.keys())
-            if len(teams) == 2:
-                team1, team2 = teams
-                prob1 = team_probs.get(team1, 0.5)
-                prob2 = team_probs.get(team2, 0.5)
-                
-                # Normalize probabilities
-                total_prob = prob1 + prob2
+            # Normalize probabilities unless they already sum to 1
+            total_prob = prob1 + prob2
+            if abs(total_prob - 1.0) > 1e-6:
                 if total_prob > 0:
                     prob1 = prob1 / total_prob
                     prob2 = prob2 / total_prob
                 else:
                     prob1 = 0.5
                     prob2 = 0.5
-                
-                # Update probabilities
-                team_probs[team1] = round(prob1, 3)
-                team_probs[team2] = round(prob2, 3)
-                
-                # Update win probability
-                match_prediction['prediction']['win_probability'] = round(max(prob1, prob2), 3)
-        
-        # Ensure expected scores are realistic for the format
-        expected_scores = match_prediction.get('expected_scores', {})
-        if expected_scores:
-            for team, score in expected_scores.items():
-                if format_type.upper() == 'T20I':
-                    # T20 scores typically range from 120-220
-                    expected_scores[team] = max(120, min(score, 220))
-                elif format_type.upper() == 'ODI':
-                    # ODI scores typically range from 200-350
-                    expected_scores[team] = max(200, min(score, 350))
-        
-        return match_prediction
\ No newline at end of file
+            prob1 = round(prob1, 3)
+            prob2 = round(prob2, 3)
+            
+            # Update probabilities that changed
+            if team_probs[team1] != prob1:
+                team_probs[team1] = prob1
+            if team_probs[team2] != prob2:
+                team_probs[team2] = prob2
+            
+            # Update win probability
+            win_probability = max(prob1, prob2)
+            prediction = match_prediction['prediction']
+            if prediction.get('win_probability') != win_probability:
+                prediction['win_probability'] = win_probability
+    
+    # Ensure expected scores are realistic for the format
+    expected_scores = match_prediction.get('expected_scores')
+    score_range = _SCORE_RANGES.get((format_type or 'T20I').upper())
+    if expected_scores and score_range:
+        low, high = score_range
+        for team, score in expected_scores.items():
+            if not low <= score <= high:
+                expected_scores[team] = max(low, min(score, high))
+    
+    return match_prediction
+
+
+class DataConsistency:
+    """
+    Ensures data consistency across the cricket prediction system.
+    
+    Thin wrapper around the module-level functions, kept for backward compatibility.
+    """
+    
+    ensure_batting_consistency: ClassVar[Callable[..., Any]] = staticmethod(ensure_batting_consistency)
+    ensure_bowling_consistency: ClassVar[Callable[..., Any]] = staticmethod(ensure_bowling_consistency)
+    ensure_batting_consistency_many: ClassVar[Callable[..., Any]] = staticmethod(ensure_batting_consistency_many)
+    ensure_bowling_consistency_many: ClassVar[Callable[..., Any]] = staticmethod(ensure_bowling_consistency_many)
+    ensure_player_role_consistency: ClassVar[Callable[..., Any]] = staticmethod(ensure_player_role_consistency)
+    ensure_fantasy_team_consistency: ClassVar[Callable[..., Any]] = staticmethod(ensure_fantasy_team_consistency)
+    ensure_fantasy_team_consistency_batch: ClassVar[Callable[..., Any]] = staticmethod(ensure_fantasy_team_consistency_batch)
+    ensure_match_prediction_consistency: ClassVar[Callable[..., Any]] = staticmethod(ensure_match_prediction_consistency)
\ No newline at end of file
@@ -0,0 +1,220 @@
+"""
+Tests for the data consistency module.
+"""
+import copy
+import math
+import random
+
+import pytest
+
+from src.utils.helpers import data_consistency as dc
+
+
+def _random_value(rng: random.Random):
+    """Pick a stat value covering ints, floats, zeros, negatives, rounding ties and huge values."""
+    return rng.choice([0, 0.0, 1, 30, -1, 1.25, 0.35, 2.45, rng.uniform(-5, 80), rng.randint(0, 60),
+                       rng.randint(0, 200) / 20, 1e308, math.inf])
+
+
+def _random_rows(keys, count=2000, seed=0):
+    """Build stat dictionaries, some of them missing fields."""
+    rng = random.Random(seed)
+    return [{key: _random_value(rng) for key in keys if rng.random() < 0.9} for _ in range(count)]
+
+
+def _typed(rows):
+    """Represent rows with value types so 30 and 30.0 are told apart."""
+    return [{key: (type(value), value) for key, value in row.items()} for row in rows]
+
+
+def test_batting_many_matches_scalar():
+    rows = _random_rows(dc._BAT_KEYS)
+    # Ints too large for a float are kept as in the scalar path
+    rows += [{'expected_runs': 10 ** 400}, {'expected_runs': 2 ** 60 + 1, 'expected_balls': 3, 'expected_sixes': 2}]
+    original = copy.deepcopy(rows)
+    
+    expected = [dc.ensure_batting_consistency(row) for row in rows]
+    result = dc.ensure_batting_consistency_many(rows)
+    
+    assert _typed(result) == _typed(expected)
+    assert [list(row) for row in result] == [list(row) for row in expected]
+    assert rows == original
+    
+    # Values the scalar path rejects are rejected in batches too
+    for row in ({'expected_runs': None}, {'expected_runs': '30', 'expected_balls': '20'}):
+        with pytest.raises(TypeError):
+            dc.ensure_batting_consistency(row)
+        with pytest.raises(TypeError):
+            dc.ensure_batting_consistency_many([{'expected_runs': 30, 'expected_balls': 20}, row])
+
+
+@pytest.mark.parametrize('format_type', ['T20I', 'odi', 'Test', None])
+def test_bowling_many_matches_scalar(format_type):
+    rows = _random_rows(dc._BOWL_KEYS, seed=1)
+    original = copy.deepcopy(rows)
+    
+    expected = [dc.ensure_bowling_consistency(row, format_type) for row in rows]
+    result = dc.ensure_bowling_consistency_many(rows, format_type)
+    
+    assert _typed(result) == _typed(expected)
+    assert [list(row) for row in result] == [list(row) for row in expected]
+    assert rows == original
+
+
+def test_infinite_and_huge_values_are_kept():
+    batting = dc.ensure_batting_consistency({'expected_runs': math.inf, 'expected_balls': 1e308})
+    bowling = dc.ensure_bowling_consistency({'expected_wickets': math.inf, 'expected_economy': 1e308}, 'Test')
+    
+    assert batting['expected_runs'] == math.inf
+    assert batting['expected_balls'] == 1e308
+    assert bowling['expected_wickets'] == math.inf
+    assert bowling['expected_economy'] == 1e308
+
+
+def test_values_round_like_round_and_limits_stay_ints():
+    batting = {'expected_runs': 0.35, 'expected_balls': 0.25, 'expected_fours': -1}
+    bowling = {'expected_overs': 6, 'expected_economy': 7, 'expected_wickets': 0.25, 'expected_runs_conceded': 2.45}
+    
+    for result in (dc.ensure_batting_consistency(batting), dc.ensure_batting_consistency_many([batting])[0]):
+        assert _typed([result]) == _typed([{'expected_runs': 0.3, 'expected_balls': 1, 'expected_fours': 0,
+                                            'expected_strike_rate': 140.0, 'expected_sixes': 0}])
+    for result in (dc.ensure_bowling_consistency(bowling), dc.ensure_bowling_consistency_many([bowling])[0]):
+        assert _typed([result]) == _typed([{'expected_overs': 4, 'expected_economy': 7, 'expected_wickets': 0.2,
+                                            'expected_runs_conceded': 42}])
+    assert dc.ensure_bowling_consistency({'expected_economy': 2.45})['expected_economy'] == 2.5
+
+
+def test_many_updates_in_place_without_copy():
+    rows = [{'expected_runs': 30, 'expected_balls': 20}]
+    
+    result = dc.ensure_batting_consistency_many(rows, copy=False)
+    
+    assert result is rows
+    assert rows[0]['expected_strike_rate'] == 150.0
+    assert type(rows[0]['expected_runs']) is int
+
+
+@pytest.mark.parametrize('role, canonical_role', [
+    ('Batsman', 'batsman'),
+    ('batter', 'batsman'),
+    ('Opening Batter', 'batsman'),
+    ('wicketkeeper batter', 'batsman'),
+    ('Top-order Batsman', 'batsman'),
+    ('Bowler', 'bowler'),
+    ('Fast Bowler', 'bowler'),
+    ('All-rounder', 'allrounder'),
+    ('all rounder', 'allrounder'),
+    ('Allrounder', 'allrounder'),
+    ('Bowling Allrounder', 'allrounder'),
+    ('Batting All-Rounder', 'allrounder'),
+    ('Wicketkeeper', None),
+    ('', None)
+])
+def test_role_resolution(role, canonical_role):
+    expected = dc._ROLE_RULES[canonical_role] if canonical_role else None
+    assert dc._resolve_role(role) == expected
+
+
+def test_player_role_limits():
+    prediction = {'batting': {'expected_runs': 5}, 'bowling': {'expected_wickets': 2}}
+    
+    batter = dc.ensure_player_role_consistency({'personalInformation': {'role': 'Opening Batter'}}, prediction)
+    bowler = dc.ensure_player_role_consistency({'personalInformation': {'role': 'Bowler'}}, prediction)
+    unknown = dc.ensure_player_role_consistency({'personalInformation': {'role': 'Wicketkeeper'}}, prediction)
+    
+    assert batter == {'batting': {'expected_runs': 20}, 'bowling': {'expected_wickets': 0.5}}
+    assert bowler == {'batting': {'expected_runs': 5}, 'bowling': {'expected_wickets': 2}}
+    assert unknown == prediction
+
+
+def test_player_role_copies_by_default():
+    player = {'personalInformation': {'role': 'Bowler'}}
+    prediction = {'batting': {'expected_runs': 40}, 'bowling': {'expected_wickets': 0}}
+    original = copy.deepcopy(prediction)
+    
+    result = dc.ensure_player_role_consistency(player, prediction)
+    
+    assert result == {'batting': {'expected_runs': 15}, 'bowling': {'expected_wickets': 1}}
+    assert prediction == original
+    
+    in_place = dc.ensure_player_role_consistency(player, prediction, copy=False)
+    
+    assert in_place is prediction
+    assert prediction == result
+
+
+def test_match_prediction_copies_by_default():
+    match_prediction = {
+        'prediction': {'team_probabilities': {'A': 0.9, 'B': 0.6}},
+        'expected_scores': {'A': 300, 'B': 100}
+    }
+    original = copy.deepcopy(match_prediction)
+    
+    result = dc.ensure_match_prediction_consistency(match_prediction)
+    
+    assert result == {
+        'prediction': {'team_probabilities': {'A': 0.6, 'B': 0.4}, 'win_probability': 0.6},
+        'expected_scores': {'A': 220, 'B': 120}
+    }
+    assert match_prediction == original
+    
+    in_place = dc.ensure_match_prediction_consistency(match_prediction, copy=False)
+    
+    assert in_place is match_prediction
+    assert match_prediction == result
+
+
+@pytest.mark.parametrize('format_type, scores, expected', [
+    ('T20I', {'A': 250, 'B': 90}, {'A': 220, 'B': 120}),
+    ('t20', {'A': 250, 'B': 90}, {'A': 220, 'B': 120}),
+    ('ODI', {'A': 400, 'B': 150}, {'A': 350, 'B': 200}),
+    ('Test', {'A': 800, 'B': -5}, {'A': 700, 'B': 0}),
+    ('Test', {'A': 650, 'B': 0}, {'A': 650, 'B': 0}),
+    ('The Hundred', {'A': 800, 'B': -5}, {'A': 800, 'B': -5})
+])
+def test_expected_scores_clamped_per_format(format_type, scores, expected):
+    result = dc.ensure_match_prediction_consistency({'expected_scores': scores}, format_type)
+    
+    assert result['expected_scores'] == expected
+
+
+@pytest.mark.parametrize('format_type, expected_overs', [('T20I', 4), ('T20', 4), ('ODI', 10), ('Test', 12)])
+def test_overs_capped_per_format(format_type, expected_overs):
+    result = dc.ensure_bowling_consistency({'expected_overs': 12}, format_type)
+    
+    assert result['expected_overs'] == expected_overs
+
+
+def _random_teams(count=200, seed=2):
+    """Build fantasy teams with random performances and captain picks."""
+    rng = random.Random(seed)
+    teams = []
+    for _ in range(count):
+        players = []
+        for number in range(rng.choice([10, 11])):
+            performance = {}
+            if rng.random() < 0.9:
+                performance['batting'] = {key: _random_value(rng) for key in dc._BAT_KEYS if rng.random() < 0.9}
+            if rng.random() < 0.6:
+                performance['bowling'] = {key: _random_value(rng) for key in dc._BOWL_KEYS if rng.random() < 0.9}
+            players.append({'name': f'player{number}', 'performance': performance})
+        teams.append({'players': players, 'captain': rng.choice(['player1', 'unknown']), 'vice_captain': 'player2'})
+    return teams
+
+
+@pytest.mark.parametrize('format_type', ['T20I', 'ODI', 'Test'])
+def test_fantasy_team_batch_matches_scalar(format_type):
+    teams = _random_teams()
+    original = copy.deepcopy(teams)
+    
+    expected = [dc.ensure_fantasy_team_consistency(team, format_type) for team in teams]
+    result = dc.ensure_fantasy_team_consistency_batch(teams, format_type)
+    
+    assert result == expected
+    for result_team, expected_team in zip(result, expected):
+        for result_player, expected_player in zip(result_team['players'], expected_team['players']):
+            for side in ('batting', 'bowling'):
+                if side in expected_player['performance']:
+                    assert (_typed([result_player['performance'][side]])
+                            == _typed([expected_player['performance'][side]]))
+    assert teams == original